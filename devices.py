@@ -106,6 +106,9 @@ class Devices:
 
         self.devices_list = []
 
+        # devices_dictionary stores {device_id: Device} for fast look-ups
+        self.devices_dictionary = {}
+
         gate_strings = ["AND", "OR", "NAND", "NOR", "XOR"]
         device_strings = ["CLOCK", "SWITCH", "DTYPE", "SIGGEN", "RC"]
         dtype_inputs = ["CLK", "SET", "CLEAR", "DATA"]
@@ -130,10 +133,7 @@ class Devices:
 
     def get_device(self, device_id):
         """Return the Device object corresponding to device_id."""
-        for device in self.devices_list:
-            if device.device_id == device_id:
-                return device
-        return None
+        return self.devices_dictionary.get(device_id)
 
     def find_devices(self, device_kind=None):
         """Return a list of device IDs of the specified device_kind.
@@ -154,6 +154,7 @@ class Devices:
         new_device = Device(device_id)
         new_device.device_kind = device_kind
         self.devices_list.append(new_device)
+        self.devices_dictionary.setdefault(device_id, new_device)
 
     def add_input(self, device_id, input_id):
         """Add the specified input to the specified device.
@@ -264,7 +265,7 @@ class Devices:
 
         for input_number in range(1, no_of_inputs + 1):
             input_name = "".join(["i", str(input_number)])
-            [input_id] = self.names.lookup([input_name])
+            input_id = self.names.lookup_one(input_name)
             self.add_input(device_id, input_id)
 
     def make_d_type(self, device_id):
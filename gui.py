@@ -8,9 +8,10 @@ Classes:
 MyGLCanvas - handles all canvas drawing operations.
 Gui - configures the main window and all the widgets.
 """
+import ctypes
+import logging
 import wx
 import wx.glcanvas as wxcanvas
-from OpenGL import GL, GLUT
 import sys
 
 from names import Names
@@ -21,6 +22,28 @@ from scanner import Scanner
 from parse import Parser
 from userint import UserInterface
 
+logger = logging.getLogger(__name__)
+
+# Flattened (x, y) line strip vertices of the sample signal trace, which
+# alternates between LOW (y = 75) and HIGH (y = 100) every 20 units
+SAMPLE_TRACE = tuple(coordinate
+                     for i in range(10)
+                     for coordinate in ((i * 20) + 10, 100 if i % 2 else 75,
+                                        (i * 20) + 30, 100 if i % 2 else 75))
+
+# The OpenGL modules are imported when the first canvas is created
+GL = None
+GLUT = None
+
+
+def load_gl():
+    """Import the OpenGL modules and initialise GLUT, once."""
+    global GL, GLUT
+    if GL is None:
+        from OpenGL import GL as gl_module, GLUT as glut_module
+        GL = gl_module
+        GLUT = glut_module
+        GLUT.glutInit()
 
 
 class MyGLCanvas(wxcanvas.GLCanvas):
@@ -34,32 +57,75 @@ class MyGLCanvas(wxcanvas.GLCanvas):
     parent: parent window.
     devices: instance of the devices.Devices() class.
     monitors: instance of the monitors.Monitors() class.
+    double_buffer: if True, draw into a back buffer and swap it to the front
+                   after each frame; otherwise draw straight to the screen,
+                   unless the display has no single-buffered visual.
 
     Public methods
     --------------
     init_gl(self): Configures the OpenGL context.
 
+    apply_view(self): Loads the modelview matrix for the current pan and
+                      zoom.
+
     render(self, text): Handles all drawing operations.
 
+    render_status(self, text): Redraws only the status text area.
+
+    queue_status(self, text): Shows the status text after pending events,
+                              drawing only the latest of several updates.
+
     on_paint(self, event): Handles the paint event.
 
     on_size(self, event): Handles the canvas resize event.
 
+    on_destroy(self, event): Handles the canvas destroy event.
+
     on_mouse(self, event): Handles mouse events.
 
     render_text(self, text, x_pos, y_pos): Handles text drawing
                                            operations.
     """
 
-    def __init__(self, parent, devices, monitors):
+    # Zoom factors for a single notch of the mouse wheel
+    _ZOOM_OUT_NOTCH = 1.0 - 1.0 / 20
+    _ZOOM_IN_NOTCH = 1.0 / (1.0 - 1.0 / 20)
+
+    # Status text template for mouse drags
+    _DRAG_TEXT = "Mouse dragged to: {}, {}. Pan is now: {}, {}"
+
+    def __init__(self, parent, devices, monitors, double_buffer=False):
         """Initialise canvas properties and useful variables."""
-        super().__init__(parent, -1,
-                         attribList=[wxcanvas.WX_GL_RGBA,
-                                     wxcanvas.WX_GL_DOUBLEBUFFER,
-                                     wxcanvas.WX_GL_DEPTH_SIZE, 16, 0])
-        GLUT.glutInit()
+        attributes = [wxcanvas.WX_GL_RGBA, wxcanvas.WX_GL_DEPTH_SIZE, 16, 0]
+        if not double_buffer and not wxcanvas.GLCanvas.IsDisplaySupported(
+                attributes):
+            # No single-buffered visual is available, so fall back to double
+            # buffering
+            double_buffer = True
+        if double_buffer:
+            attributes.insert(1, wxcanvas.WX_GL_DOUBLEBUFFER)
+        super().__init__(parent, -1, attribList=attributes)
+        load_gl()
+        self.double_buffer = double_buffer
         self.init = False
+        self.view_changed = False  # pan or zoom changed since the last draw
         self.context = wxcanvas.GLContext(self)
+        self.size = self.GetClientSize()  # updated on every resize event
+
+        # Base of the display lists holding the pre-rendered font glyphs,
+        # built once the OpenGL context is current
+        self._font_base = None
+
+        # Vertex buffer object holding the signal trace line strip
+        self._trace_vbo = None
+        self._trace_vertex_count = 0
+
+        # Status text waiting to be drawn by the next paint event
+        self._status_text = None
+        # Whether the next paint event shows the drag status text instead
+        self._drag_pending = False
+        self._status_line_count = 1  # lines in the status text last drawn
+        self._queued_status = None  # status text waiting for queue_status
 
         # Initialise variables for panning
         self.pan_x = 0
@@ -74,21 +140,43 @@ class MyGLCanvas(wxcanvas.GLCanvas):
         self.Bind(wx.EVT_PAINT, self.on_paint)
         self.Bind(wx.EVT_SIZE, self.on_size)
         self.Bind(wx.EVT_MOUSE_EVENTS, self.on_mouse)
+        self.Bind(wx.EVT_WINDOW_DESTROY, self.on_destroy)
 
     def init_gl(self):
-        """Configure and initialise the OpenGL context."""
-        size = self.GetClientSize()
-        self.SetCurrent(self.context)
-        GL.glDrawBuffer(GL.GL_BACK)
+        """Configure and initialise the OpenGL context.
+
+        The context must already be current, as it is inside render().
+        """
+        size = self.size
+        if self.double_buffer:
+            GL.glDrawBuffer(GL.GL_BACK)
+        else:
+            GL.glDrawBuffer(GL.GL_FRONT)
         GL.glClearColor(0.95, 0.89, 0.59, 0.0)
         GL.glViewport(0, 0, size.width, size.height)
         GL.glMatrixMode(GL.GL_PROJECTION)
         GL.glLoadIdentity()
         GL.glOrtho(0, size.width, 0, size.height, -1, 1)
+        self.apply_view()
+        if self._font_base is None:
+            self._init_font()
+
+    def apply_view(self):
+        """Load the modelview matrix for the current pan and zoom."""
         GL.glMatrixMode(GL.GL_MODELVIEW)
         GL.glLoadIdentity()
         GL.glTranslated(self.pan_x, self.pan_y, 0.0)
         GL.glScaled(self.zoom, self.zoom, self.zoom)
+        self.view_changed = False
+
+    def _init_font(self):
+        """Compile the printable ASCII glyphs into OpenGL display lists."""
+        font = GLUT.GLUT_BITMAP_HELVETICA_12
+        self._font_base = GL.glGenLists(128)
+        for character in range(32, 127):
+            GL.glNewList(self._font_base + character, GL.GL_COMPILE)
+            GLUT.glutBitmapCharacter(font, character)
+            GL.glEndList()
 
     def render(self, text):
         """Handle all drawing operations."""
@@ -97,114 +185,210 @@ class MyGLCanvas(wxcanvas.GLCanvas):
             # Configure the viewport, modelview and projection matrices
             self.init_gl()
             self.init = True
+        elif self.view_changed:
+            # Only the modelview matrix depends on the pan and zoom
+            self.apply_view()
+
+        self._draw_scene(text)
 
+        # Flush the graphics pipeline, and if we have been drawing to the back
+        # buffer, swap it to the front
+        GL.glFlush()
+        if self.double_buffer:
+            self.SwapBuffers()
+
+    def render_status(self, text):
+        """Redraw only the part of the canvas covered by the status text."""
+        if not self.init or self.view_changed:
+            # Everything on the canvas has moved, so redraw all of it
+            self.render(text)
+            return
+        self.SetCurrent(self.context)
+
+        # The back buffer is undefined after a swap, so the partial redraw is
+        # made directly in the front buffer
+        if self.double_buffer:
+            GL.glDrawBuffer(GL.GL_FRONT)
+        GL.glEnable(GL.GL_SCISSOR_TEST)
+        GL.glScissor(*self._status_rect(text))
+        self._draw_scene(text)
+        GL.glDisable(GL.GL_SCISSOR_TEST)
+        if self.double_buffer:
+            GL.glDrawBuffer(GL.GL_BACK)
+        GL.glFlush()
+
+    def queue_status(self, text):
+        """Show the status text once the pending events have been handled."""
+        if self._queued_status is None:
+            wx.CallAfter(self._show_queued_status)
+        self._queued_status = text
+
+    def _show_queued_status(self):
+        """Draw the most recently queued status text."""
+        text = self._queued_status
+        self._queued_status = None
+        if text is not None:
+            self.render_status(text)
+
+    def _status_rect(self, text):
+        """Return the window rectangle covering the old and new status text."""
+        line_count = max(self._status_line_count, text.count('\n') + 1)
+        width = self.size.width
+        # The first baseline is at y = 10 in object coordinates and each line
+        # is 20 below the last; glyphs reach 14 pixels above the baseline and
+        # 4 below it
+        top = self.pan_y + 10 * self.zoom + 14
+        bottom = self.pan_y + (10 - 20 * (line_count - 1)) * self.zoom - 4
+        return 0, int(bottom), width, int(top - bottom) + 1
+
+    def _draw_scene(self, text):
+        """Clear the canvas and draw the status text and signal trace."""
         # Clear everything
         GL.glClear(GL.GL_COLOR_BUFFER_BIT)
 
         # Draw specified text at position (10, 10)
         self.render_text(text, 10, 10)
+        self._status_line_count = text.count('\n') + 1
 
         # Draw a sample signal trace
+        if self._trace_vbo is None:
+            self._upload_trace()
         GL.glColor3f(0.0, 0.0, 1.0)  # signal trace is blue
-        GL.glBegin(GL.GL_LINE_STRIP)
-        for i in range(10):
-            x = (i * 20) + 10
-            x_next = (i * 20) + 30
-            if i % 2 == 0:
-                y = 75
-            else:
-                y = 100
-            GL.glVertex2f(x, y)
-            GL.glVertex2f(x_next, y)
-        GL.glEnd()
-
-        # We have been drawing to the back buffer, flush the graphics pipeline
-        # and swap the back buffer to the front
-        GL.glFlush()
-        self.SwapBuffers()
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._trace_vbo)
+        GL.glVertexPointer(2, GL.GL_FLOAT, 0, None)
+        GL.glDrawArrays(GL.GL_LINE_STRIP, 0, self._trace_vertex_count)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+
+    def _upload_trace(self):
+        """Upload the signal trace vertices into a vertex buffer object."""
+        vertices = SAMPLE_TRACE
+        data = (GL.GLfloat * len(vertices))(*vertices)
+
+        if self._trace_vbo is None:
+            self._trace_vbo = GL.glGenBuffers(1)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self._trace_vbo)
+        GL.glBufferData(GL.GL_ARRAY_BUFFER, ctypes.sizeof(data), data,
+                        GL.GL_STATIC_DRAW)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        self._trace_vertex_count = len(vertices) // 2
 
     def on_paint(self, event):
         """Handle the paint event."""
-        self.SetCurrent(self.context)
-        if not self.init:
-            # Configure the viewport, modelview and projection matrices
-            self.init_gl()
-            self.init = True
-
-        size = self.GetClientSize()
-        text = "".join(["Canvas redrawn on paint event, size is ",
-                        str(size.width), ", ", str(size.height)])
+        if self._drag_pending:
+            text = self._DRAG_TEXT.format(self.last_mouse_x,
+                                          self.last_mouse_y,
+                                          self.pan_x, self.pan_y)
+        elif self._status_text is None:
+            size = self.size
+            text = ("Canvas redrawn on paint event, size is "
+                    f"{size.width}, {size.height}")
+        else:
+            text = self._status_text
+        self._status_text = None
+        self._drag_pending = False
         self.render(text)
 
     def on_size(self, event):
         """Handle the canvas resize event."""
+        self.size = self.GetClientSize()
         # Forces reconfiguration of the viewport, modelview and projection
         # matrices on the next paint event
         self.init = False
 
+    def on_destroy(self, event):
+        """Handle the canvas destroy event."""
+        # Release the display lists and buffers owned by this canvas
+        if event.GetEventObject() is self and (
+                self._font_base is not None or self._trace_vbo is not None):
+            self.SetCurrent(self.context)
+            if self._font_base is not None:
+                GL.glDeleteLists(self._font_base, 128)
+                self._font_base = None
+            if self._trace_vbo is not None:
+                GL.glDeleteBuffers(1, [self._trace_vbo])
+                self._trace_vbo = None
+        event.Skip()
+
     def on_mouse(self, event):
         """Handle mouse events."""
         text = ""
+        dragged = False
+        x = event.GetX()
+        y = event.GetY()
+        wheel_rotation = event.GetWheelRotation()
         # Calculate object coordinates of the mouse position
-        size = self.GetClientSize()
-        ox = (event.GetX() - self.pan_x) / self.zoom
-        oy = (size.height - event.GetY() - self.pan_y) / self.zoom
+        height = self.size.height
+        inv_zoom = 1.0 / self.zoom
+        ox = (x - self.pan_x) * inv_zoom
+        oy = (height - y - self.pan_y) * inv_zoom
         old_zoom = self.zoom
         if event.ButtonDown():
-            self.last_mouse_x = event.GetX()
-            self.last_mouse_y = event.GetY()
-            text = "".join(["Mouse button pressed at: ", str(event.GetX()),
-                            ", ", str(event.GetY())])
+            self.last_mouse_x = x
+            self.last_mouse_y = y
+            text = f"Mouse button pressed at: {x}, {y}"
         if event.ButtonUp():
-            text = "".join(["Mouse button released at: ", str(event.GetX()),
-                            ", ", str(event.GetY())])
+            text = f"Mouse button released at: {x}, {y}"
         if event.Leaving():
-            text = "".join(["Mouse left canvas at: ", str(event.GetX()),
-                            ", ", str(event.GetY())])
+            text = f"Mouse left canvas at: {x}, {y}"
         if event.Dragging():
-            self.pan_x += event.GetX() - self.last_mouse_x
-            self.pan_y -= event.GetY() - self.last_mouse_y
-            self.last_mouse_x = event.GetX()
-            self.last_mouse_y = event.GetY()
-            self.init = False
-            text = "".join(["Mouse dragged to: ", str(event.GetX()),
-                            ", ", str(event.GetY()), ". Pan is now: ",
-                            str(self.pan_x), ", ", str(self.pan_y)])
-        if event.GetWheelRotation() < 0:
-            self.zoom *= (1.0 + (
-                event.GetWheelRotation() / (20 * event.GetWheelDelta())))
-            # Adjust pan so as to zoom around the mouse position
-            self.pan_x -= (self.zoom - old_zoom) * ox
-            self.pan_y -= (self.zoom - old_zoom) * oy
-            self.init = False
-            text = "".join(["Negative mouse wheel rotation. Zoom is now: ",
-                            str(self.zoom)])
-        if event.GetWheelRotation() > 0:
-            self.zoom /= (1.0 - (
-                event.GetWheelRotation() / (20 * event.GetWheelDelta())))
+            self.pan_x += x - self.last_mouse_x
+            self.pan_y -= y - self.last_mouse_y
+            self.last_mouse_x = x
+            self.last_mouse_y = y
+            self.view_changed = True
+            dragged = True
+        if wheel_rotation:
+            wheel_delta = event.GetWheelDelta()
+            if wheel_rotation == -wheel_delta:
+                factor = self._ZOOM_OUT_NOTCH
+            elif wheel_rotation == wheel_delta:
+                factor = self._ZOOM_IN_NOTCH
+            elif wheel_rotation < 0:
+                factor = 1.0 + (wheel_rotation / (20 * wheel_delta))
+            else:
+                factor = 1.0 / (1.0 - (wheel_rotation / (20 * wheel_delta)))
+            self.zoom *= factor
             # Adjust pan so as to zoom around the mouse position
             self.pan_x -= (self.zoom - old_zoom) * ox
             self.pan_y -= (self.zoom - old_zoom) * oy
-            self.init = False
-            text = "".join(["Positive mouse wheel rotation. Zoom is now: ",
-                            str(self.zoom)])
+            self.view_changed = True
+            if wheel_rotation < 0:
+                text = ("Negative mouse wheel rotation. "
+                        f"Zoom is now: {self.zoom}")
+            else:
+                text = ("Positive mouse wheel rotation. "
+                        f"Zoom is now: {self.zoom}")
+        if text and not self.view_changed:
+            # Only the status text has changed, so draw it straight away
+            # without a full redraw and buffer swap
+            self.render_status(text)
+            return
         if text:
-            self.render(text)
-        else:
-            self.Refresh()  # triggers the paint event
+            self._status_text = text
+            self._drag_pending = False
+        elif dragged:
+            # Formatted by on_paint, once per redraw rather than per event
+            self._status_text = None
+            self._drag_pending = True
+        # Queue a paint event rather than drawing immediately, so that a burst
+        # of mouse events is coalesced into a single redraw
+        self.Refresh(eraseBackground=False)
 
     def render_text(self, text, x_pos, y_pos):
         """Handle text drawing operations."""
         GL.glColor3f(0.0, 0.0, 0.0)  # text is black
-        GL.glRasterPos2f(x_pos, y_pos)
-        font = GLUT.GLUT_BITMAP_HELVETICA_12
+        GL.glListBase(self._font_base)
 
-        for character in text:
-            if character == '\n':
-                y_pos = y_pos - 20
-                GL.glRasterPos2f(x_pos, y_pos)
-            else:
-                GLUT.glutBitmapCharacter(font, ord(character))
+        # Each line is drawn with a single call into the glyph display lists
+        for line in text.split('\n'):
+            GL.glRasterPos2f(x_pos, y_pos)
+            line_bytes = line.encode('ascii', 'replace')
+            if line_bytes:
+                GL.glCallLists(len(line_bytes), GL.GL_UNSIGNED_BYTE,
+                               line_bytes)
+            y_pos = y_pos - 20
 
 
 class Gui(wx.Frame):
@@ -212,30 +396,17 @@ class Gui(wx.Frame):
 
     This class provides a graphical user interface for the Logic Simulator and
     enables the user to change the circuit properties and run simulations.
-   def run_command(self):
-        #Run the simulation from scratch.
-        self.cycles_completed = 0
-        cycles = self.read_number(0, None)
-   def run_command(self):
-        #Run the simulation from scratch.
-        self.cycles_completed = 0
-        cycles = self.read_number(0, None)
 
-        if cycles is not None:  # if the number of cycles provided is valid
-            self.monitors.reset_monitors()
-            print("".join(["Running for ", str(cycfrom userint import UserInterfaceles), " cycles"]))
-            self.devices.cold_startup()
-            if self.run_network(cycles):
-                self.cycles_completed += cycles
-        if cycles is not None:  # if the number of cycles provided is valid
-            self.monitors.reset_monitors()
-            print("".join(["Running for ", str(cycles), " cycles"]))
-            self.devices.cold_startup()
-            if self.run_network(cycles):
-                self.cycles_completed += cycles
     Parameters
     ----------
     title: title of the window.
+    path: path to the circuit definition file.
+    names: instance of the names.Names() class.
+    devices: instance of the devices.Devices() class.
+    network: instance of the network.Network() class.
+    monitors: instance of the monitors.Monitors() class.
+    double_buffer: if True, the canvas draws into a back buffer and swaps it
+                   to the front after each frame.
 
     Public methods
     --------------
@@ -262,11 +433,15 @@ class Gui(wx.Frame):
     on_zap_monitor_button(self, event): Event handler for when the user clicks the zap monitor
                                 button.
     
+    update_signal_choices(self): Refills the signal and monitor comboboxes
+                                after a monitor is made or zapped.
+
     on_quit_button(self, event): Event handler for when the user clicks the quit
                                 button.
     """
 
-    def __init__(self, title, path, names, devices, network, monitors):
+    def __init__(self, title, path, names, devices, network, monitors,
+                 double_buffer=False):
         """Initialise widgets and layout."""
         super().__init__(parent=None, title=title, size=(800, 600))
 
@@ -280,7 +455,8 @@ class Gui(wx.Frame):
         self.SetMenuBar(menuBar)
 
         # Canvas for drawing signals
-        self.canvas = MyGLCanvas(self, devices, monitors)
+        self.canvas = MyGLCanvas(self, devices, monitors,
+                                 double_buffer=double_buffer)
 
         # Configure the widgets
         self.cyclestext = wx.StaticText(self, wx.ID_ANY, "Number of Cycles")
@@ -295,17 +471,24 @@ class Gui(wx.Frame):
         self.quit_button = wx.Button(self, wx.ID_ANY, "Quit")
 
         self.switext = wx.StaticText(self, label = "Switch")
-        switch_names = ["sw1","swb","swc"]
-        self.swicombobox = wx.ComboBox(self, choices = switch_names)
-
+        # switch_ids stores {switch_name: device_id} for every switch
+        self.switch_ids = {names.get_name_string(device_id): device_id
+                           for device_id in devices.find_devices(
+                               devices.SWITCH)}
+        self.swicombobox = wx.ComboBox(self, choices = list(self.switch_ids))
+
+        # signal_ids stores {signal_name: [device_id, output_id]} for every
+        # output in the network
+        monitored, non_monitored = monitors.get_signal_names()
+        self.signal_ids = {signal_name: devices.get_signal_ids(signal_name)
+                           for signal_name in monitored + non_monitored}
+
+        # Signals can be monitored, and monitored signals zapped
         self.sigtext = wx.StaticText(self, label = "Signal")
-        signal_names = ["sw1","clk1","sigc"]
-        
-        self.sigcombobox = wx.ComboBox(self, choices = signal_names)
+        self.sigcombobox = wx.ComboBox(self, choices = non_monitored)
 
         self.montext = wx.StaticText(self, label = "Monitor")
-        monitor_names = ["k", "sw1", "clk1", "sigc"]
-        self.moncombobox = wx.ComboBox(self, choices = monitor_names)
+        self.moncombobox = wx.ComboBox(self, choices = monitored)
 
 
 
@@ -427,13 +610,13 @@ class Gui(wx.Frame):
     def on_spin(self, event):
         """Handle the event when the user changes the spin control value."""
         spin_value = self.spin.GetValue()
-        text = "".join(["New spin control value: ", str(spin_value)])
-        self.canvas.render(text)
+        text = f"New spin control value: {spin_value}"
+        self.canvas.queue_status(text)
 
     def on_run_button(self, event):
         """Handle the event when the user clicks the run button."""
-        text = "".join(["Run button pressed. Should run for:", str(self.spin.GetValue())])
-        self.canvas.render(text)
+        text = f"Run button pressed. Should run for:{self.spin.GetValue()}"
+        self.canvas.queue_status(text)
         self.run_command()
 
     def run_command(self):
@@ -442,27 +625,33 @@ class Gui(wx.Frame):
         cycles = self.spin.GetValue()
         if cycles is not None:
             self.monitors.reset_monitors()
-            print("".join(["Running for ", str(cycles), " cycles"]))
+            logger.info("Running for %s cycles", cycles)
             self.devices.cold_startup()
             if self.run_network(cycles):
                 self.cycles_completed += cycles
 
     def run_network(self, cycles):
         #run simulation for set nmuber cycles
+        # Bind the per-cycle methods once, outside the loop
+        execute_network = self.network.execute_network
+        record_signals = self.monitors.record_signals
+        # Nothing needs recording or displaying if no signal is monitored
+        monitoring = bool(self.monitors.monitors_dictionary)
         for _ in range(cycles):
-            if self.network.execute_network():
-                self.monitors.record_signals()
-            else:
-                print("Error! Network oscillation.")
+            if not execute_network():
+                logger.warning("Error! Network oscillation.")
                 return False
-        self.monitors.display_signals()
+            if monitoring:
+                record_signals()
+        if monitoring:
+            self.monitors.display_signals()
         return True
 
 
     def on_continue_button(self, event):
         """Handle the event when the user clicks the continue button."""
         text = "Continue button pressed."
-        self.canvas.render(text)
+        self.canvas.queue_status(text)
         self.continue_command()
     
     def continue_command(self):
@@ -470,70 +659,68 @@ class Gui(wx.Frame):
         cycles = self.spin.GetValue()
         if cycles is not None:
             if self.cycles_completed == 0:
-                print("Error! Nothing to contiue")
+                logger.warning("Error! Nothing to contiue")
             elif self.run_network(cycles):
                 self.cycles_completed += cycles
-                print(" ".join(["Continuing for", str(cycles), "cycles.",
-                                "Total:", str(self.cycles_completed)]))
+                logger.info("Continuing for %s cycles. Total: %s", cycles,
+                            self.cycles_completed)
 
 
     def on_switch1_button(self, event):
         """Handle the event when the user clicks the switch1 button."""
         text = "On switch button pressed."
-        self.canvas.render(text)
+        self.canvas.queue_status(text)
         self.switch1_command(1)
     
     def on_switch0_button(self, event):
         """Handle the event when the user clicks the switch0 button."""
         text = "Off switch button pressed."
-        self.canvas.render(text)
+        self.canvas.queue_status(text)
         self.switch0_command(1)
 
 
     def switch1_command(self, state):
         #set the specified switch to the specified signal level
-        if self.switch_id == None:
-            print("Please select a switch")
+        if self.switch_id is None:
+            logger.warning("Please select a switch")
+        elif self.devices.set_switch(self.switch_id, 1):
+            logger.info("Successfully set switch.")
         else:
-            print(self.switch_id)
-            self.devices.set_switch(self.names.query(self.switch_id), 1)
-            print("Successfully set switch.")
+            logger.warning("Error! Invalid switch.")
 
     def switch0_command(self, state):
         #set the specified switch to the specified signal level
-        if self.switch_id == None:
-            print("Please select a switch")
+        if self.switch_id is None:
+            logger.warning("Please select a switch")
+        elif self.devices.set_switch(self.switch_id, 0):
+            logger.info("Successfully reset switch.")
         else:
-            print(self.switch_id)
-            self.devices.set_switch(self.names.query(self.switch_id), 0)
-            print("Successfully reset switch.")
+            logger.warning("Error! Invalid switch.")
 
     def on_swicombobox(self, event):
         """Handle the event when the user selects a switch."""
-        self.switch_id = self.swicombobox.GetValue()
-        text = "".join(["New switch selection: ", self.switch_id])
-        self.canvas.render(text)
-        print(self.switch_id)
+        switch_name = self.swicombobox.GetValue()
+        self.switch_id = self.switch_ids.get(switch_name)
+        text = f"New switch selection: {switch_name}"
+        self.canvas.queue_status(text)
     
     def on_sigcombobox(self, event):
         """Handle the event when the user selects a signal."""
         self.signal_id = self.sigcombobox.GetValue()
-        text = "".join(["New signal selection: ", self.signal_id])
-        self.canvas.render(text)
-        print(self.signal_id)
+        text = f"New signal selection: {self.signal_id}"
+        self.canvas.queue_status(text)
     
     def on_moncombobox(self, event):
         """Handle the event when the user selects a monitor."""
         self.monitor_id = self.moncombobox.GetValue()
-        text = "".join(["New monitor selection: ", self.monitor_id])
-        self.canvas.render(text)
-        print(self.monitor_id)
+        text = f"New monitor selection: {self.monitor_id}"
+        self.canvas.queue_status(text)
 
 
     def on_set_monitor_button(self, event):
         """Handle the event when the user clicks the set_monitor button."""
         text = "Set Monitor button pressed."
-        self.canvas.render(text)
+        self.canvas.queue_status(text)
         self.monitor_command()
     
     def read_signal_name(self):
@@ -541,52 +728,34 @@ class Gui(wx.Frame):
 
         Return None if either is invalid.
         """
-        device_id = self.names.query(self.signal_id)
-        if device_id is None:
-            return None
-        elif self.character == ".":
-            port_id = self.names.query(self.signal_id)
-            if port_id is None:
-                return None
-        else:
-            port_id = None
-        return [device_id, port_id]
+        return self.signal_ids.get(self.signal_id)
     
     def read_monitor_name(self):
         """Return the device and port IDs of the current signal name.
 
         Return None if either is invalid.
         """
-        device_id = self.names.query(self.monitor_id)
-        if device_id is None:
-            return None
-        elif self.character == ".":
-            port_id = self.names.query(self.monitor_id)
-            if port_id is None:
-                return None
-        else:
-            port_id = None
-        return [device_id, port_id]
+        return self.signal_ids.get(self.monitor_id)
     
     def monitor_command(self):
-        print(self)
         monitor = self.read_signal_name()
-        if monitor == None:
-            print("Please select a device to monitor")
+        if monitor is None:
+            logger.warning("Please select a device to monitor")
         else:
             [device, port] = monitor
             monitor_error = self.monitors.make_monitor(device, port,
                                                        self.cycles_completed)
             if monitor_error == self.monitors.NO_ERROR:
-                print("Successfully made monitor.")
+                logger.info("Successfully made monitor.")
+                self.update_signal_choices()
             else:
-                print("Error! Could not make monitor.")
+                logger.warning("Error! Could not make monitor.")
 
 
     def on_zap_monitor_button(self, event):
         """Handle the event when the user clicks the zap_monitor button."""
         text = "zap_monitor button pressed."
-        self.canvas.render(text)
+        self.canvas.queue_status(text)
         self.zap_command()
     
     def zap_command(self):
@@ -594,12 +763,22 @@ class Gui(wx.Frame):
         if monitor is not None:
             [device, port] = monitor
             if self.monitors.remove_monitor(device, port):
-                print("Successfully zapped monitor")
+                logger.info("Successfully zapped monitor")
+                self.update_signal_choices()
             else:
-                print("Error! Could not zap monitor.")
+                logger.warning("Error! Could not zap monitor.")
+
+    def update_signal_choices(self):
+        """Refill the signal and monitor comboboxes after a monitor change."""
+        monitored, non_monitored = self.monitors.get_signal_names()
+        self.sigcombobox.Set(non_monitored)
+        self.moncombobox.Set(monitored)
+        # The previous selections are no longer listed
+        self.signal_id = None
+        self.monitor_id = None
 
     def on_quit_button(self, event):
         """Handle the event when the user clicks the quit button."""
         text = "quit button pressed."
-        self.canvas.render(text)
+        self.canvas.queue_status(text)
         sys.exit()
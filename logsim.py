@@ -8,13 +8,14 @@ Usage
 -----
 Show help: logsim.py -h
 Command line user interface: logsim.py -c <file path>
-Graphical user interface: logsim.py <file path>
+Graphical user interface: logsim.py [-d] <file path>
+    -d: draw the signals with double buffering, which avoids flicker on some
+        displays
 """
 import getopt
+import logging
 import sys
 
-import wx
-
 from names import Names
 from devices import Devices
 from network import Network
@@ -22,7 +23,6 @@ from monitors import Monitors
 from scanner import Scanner
 from parse import Parser
 from userint import UserInterface
-from gui import Gui
 
 
 def main(arg_list):
@@ -34,9 +34,10 @@ def main(arg_list):
     usage_message = ("Usage:\n"
                      "Show help: logsim.py -h\n"
                      "Command line user interface: logsim.py -c <file path>\n"
-                     "Graphical user interface: logsim.py <file path>")
+                     "Graphical user interface: logsim.py [-d] <file path>\n"
+                     "  -d: draw the signals with double buffering")
     try:
-        options, arguments = getopt.getopt(arg_list, "hc:")
+        options, arguments = getopt.getopt(arg_list, "hc:d")
     except getopt.GetoptError:
         print("Error: invalid command line arguments\n")
         print(usage_message)
@@ -48,11 +49,16 @@ def main(arg_list):
     network = Network(names, devices)
     monitors = Monitors(names, devices, network)
 
+    double_buffer = False
+    command_line = False
     for option, path in options:
         if option == "-h":  # print the usage message
             print(usage_message)
             sys.exit()
+        elif option == "-d":  # double buffer the graphical user interface
+            double_buffer = True
         elif option == "-c":  # use the command line user interface
+            command_line = True
             scanner = Scanner(path, names)
             parser = Parser(names, devices, network, monitors, scanner)
             if parser.parse_network():
@@ -60,7 +66,7 @@ def main(arg_list):
                 userint = UserInterface(names, devices, network, monitors)
                 userint.command_interface()
 
-    if not options:  # no option given, use the graphical user interface
+    if not command_line:  # use the graphical user interface
 
         if len(arguments) != 1:  # wrong number of arguments
             print("Error: one file path required\n")
@@ -71,10 +77,19 @@ def main(arg_list):
         scanner = Scanner(path, names)
         parser = Parser(names, devices, network, monitors, scanner)
         if parser.parse_network():
+            # wx and OpenGL are only needed by the graphical user interface
+            import wx
+            from gui import Gui
+
+            # The graphical user interface reports the outcome of commands
+            # through logging
+            logging.basicConfig(level=logging.INFO, format="%(message)s",
+                                stream=sys.stdout)
+
             # Initialise an instance of the gui.Gui() class
             app = wx.App()
             gui = Gui("Logic Simulator", path, names, devices, network,
-                      monitors)
+                      monitors, double_buffer=double_buffer)
             gui.Show(True)
             app.MainLoop()
 
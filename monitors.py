@@ -9,6 +9,7 @@ Monitors - records and displays specified output signals.
 
 """
 import collections
+import sys
 
 
 class Monitors:
@@ -107,10 +108,10 @@ class Monitors:
 
         This function is called at every simulation cycle.
         """
-        for device_id, output_id in self.monitors_dictionary:
-            signal_level = self.get_monitor_signal(device_id, output_id)
-            self.monitors_dictionary[(device_id,
-                                      output_id)].append(signal_level)
+        get_output_signal = self.network.get_output_signal
+        for (device_id, output_id), signal_list in \
+                self.monitors_dictionary.items():
+            signal_list.append(get_output_signal(device_id, output_id))
 
     def get_signal_names(self):
         """Return two signal name lists: monitored and not monitored."""
@@ -158,20 +159,17 @@ class Monitors:
     def display_signals(self):
         """Display the signal trace(s) in the text console."""
         margin = self.get_margin()
+        symbols = {self.devices.HIGH: "-", self.devices.LOW: "_",
+                   self.devices.RISING: "/", self.devices.FALLING: "\\",
+                   self.devices.BLANK: " "}
+        lines = []
         for device_id, output_id in self.monitors_dictionary:
             monitor_name = self.devices.get_signal_name(device_id, output_id)
             name_length = len(monitor_name)
             signal_list = self.monitors_dictionary[(device_id, output_id)]
-            print(monitor_name + (margin - name_length) * " ", end=": ")
-            for signal in signal_list:
-                if signal == self.devices.HIGH:
-                    print("-", end="")
-                if signal == self.devices.LOW:
-                    print("_", end="")
-                if signal == self.devices.RISING:
-                    print("/", end="")
-                if signal == self.devices.FALLING:
-                    print("\\", end="")
-                if signal == self.devices.BLANK:
-                    print(" ", end="")
-            print("\n", end="")
+            trace = "".join([symbols.get(signal, "")
+                             for signal in signal_list])
+            lines.append(monitor_name + (margin - name_length) * " " + ": " +
+                         trace + "\n")
+        # Write all the traces at once rather than one character at a time
+        sys.stdout.write("".join(lines))
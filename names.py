@@ -34,6 +34,9 @@ class Names:
     lookup(self, name_string_list): Returns a list of name IDs for each
                         name string. Adds a name if not already present.
 
+    lookup_one(self, name_string): Returns the name ID for the name string.
+                        Adds the name if not already present.
+
     get_name_string(self, name_id): Returns the corresponding name string for
                         the name ID. Returns None if the ID is not present.
     """
@@ -69,16 +72,20 @@ class Names:
 
         If the name string is not present in the names list, add it.
         """
-        ids = []
-        for name_string in name_string_list:
-            if name_string not in self.__name2id:
-                id = self.get_new_id()
-                self.__name2id[name_string] = id
-                self.__id2name[id] = name_string
-            else:
-                id = self.__name2id[name_string]
-            ids.append(id)
-        return ids
+        return [self.lookup_one(name_string)
+                for name_string in name_string_list]
+
+    def lookup_one(self, name_string):
+        """Return the name ID for name_string.
+
+        If the name string is not present in the names list, add it.
+        """
+        id = self.__name2id.get(name_string)
+        if id is None:
+            id = self.get_new_id()
+            self.__name2id[name_string] = id
+            self.__id2name[id] = name_string
+        return id
 
     def get_name_string(self, name_id):
         """Return the corresponding name string for name_id.
@@ -17,6 +17,12 @@ class ParsingError(Exception):
     self.sym = sym
 
 
+# Raised inside the device parsers when a qualifier is invalid, and turned into
+# a ParsingError with the appropriate message
+class InvalidPattern(ValueError): pass
+class InvalidState(ValueError): pass
+
+
 class Parser:
 
   """Parse the definition file and build the logic network.
@@ -48,41 +54,40 @@ class Parser:
     self.__monitors = monitors
     self.__scanner: Scanner = scanner
 
+    # Statement parsers, keyed by the type of the symbol starting the line
+    self.__statement_parsers = {
+      Scanner.AND: self._parse_AND,
+      Scanner.NAND: self._parse_NAND,
+      Scanner.OR: self._parse_OR,
+      Scanner.NOR: self._parse_NOR,
+      Scanner.XOR: self._parse_XOR,
+      Scanner.CLOCK: self._parse_CLOCK,
+      Scanner.DTYPE: self._parse_DTYPE,
+      Scanner.SWITCH: self._parse_SWITCH,
+      Scanner.MONITOR: self._parse_monitor,
+      Scanner.SIGGEN: self._parse_SIGGEN,
+      Scanner.RC: self._parse_RC,
+    }
+
   def parse_network(self):
     """Parse the circuit definition file."""
     line_count = 1
     try:
-      while True:
-        sym = self.__scanner.get_symbol()
-
+      # Statement parsers consume the rest of each line from the same
+      # symbol stream, so each iteration starts at a new line
+      for sym in self.__scanner:
         if sym.type == Scanner.EOF:
           break
 
         # Process each symbol based on its type
-        if sym.type == Scanner.AND:
-          self._parse_AND()
-        elif sym.type == Scanner.NAND:
-          self._parse_NAND()
-        elif sym.type == Scanner.OR:
-          self._parse_OR()
-        elif sym.type == Scanner.NOR:
-          self._parse_NOR()
-        elif sym.type == Scanner.XOR:
-          self._parse_XOR()
-        elif sym.type == Scanner.CLOCK:
-          self._parse_CLOCK()
-        elif sym.type == Scanner.DTYPE:
-          self._parse_DTYPE()
-        elif sym.type == Scanner.SWITCH:
-          self._parse_SWITCH()
-        elif sym.type == Scanner.MONITOR:
-          self._parse_monitor()
-        elif sym.type == Scanner.NAME:
+        if sym.type == Scanner.NAME:
           self._parse_connection(sym)
-        elif sym.type == Scanner.SIGGEN:
-          self._parse_SIGGEN()
-        elif sym.type == Scanner.RC:
-          self._parse_RC()
+        elif sym.type == Scanner.INVALID:
+          raise ParsingError("Invalid character", sym=sym)
+        else:
+          parse = self.__statement_parsers.get(sym.type)
+          if parse is not None:
+            parse()
 
         line_count += 1
     except ParsingError as e:
@@ -145,39 +150,36 @@ class Parser:
     if sym.type != Scanner.DOT:
       raise ParsingError("Expecting '.'", sym=sym)
 
-  def _parse_gate(self, **kwargs):
+  def _parse_positive_number(self):
+    sym = self.__scanner.get_symbol()
+    if sym.type != Scanner.NUMBER:
+      raise ParsingError("Expecting a number > 0", sym=sym)
+
+    # NUMBER symbols are ASCII digit strings, so without a leading zero the
+    # value is at least 1
+    name_string = self.__names.get_name_string(sym.id)
+    if name_string[0] == "0":
+      raise ParsingError("Expecting a number > 0", sym=sym)
+
+    return int(name_string), sym
+
+  def _parse_gate(self, device_kind):
     device_id = self._parse_identifier()
 
     # Default to XOR: 2 inputs
     no_of_inputs = 2
 
-    if kwargs["device_kind"] != self.__devices.XOR:
+    if device_kind != self.__devices.XOR:
       self._parse_open_bracket()
 
-      class InvalidNoOfInputs(ValueError): pass
-      try:
-        # no_of_inputs
-        sym = self.__scanner.get_symbol()
-        if sym.type != Scanner.NUMBER:
-          raise InvalidNoOfInputs
-        
-        number = self.__names.get_name_string(sym.id)
-
-        if number[0] == "0":
-          raise InvalidNoOfInputs
-
-        no_of_inputs = int(number)
-
-        if no_of_inputs > 16 or no_of_inputs < 1:
-          raise ParsingError("Expecting a number from 1-16", sym=sym)
-      except InvalidNoOfInputs:
-        raise ParsingError("Expecting a number > 0", sym=sym)
+      no_of_inputs, sym = self._parse_positive_number()
+      if no_of_inputs > 16:
+        raise ParsingError("Expecting a number from 1-16", sym=sym)
 
       self._parse_close_bracket()
 
-    kwargs.update(dict(device_id=device_id, no_of_inputs=no_of_inputs))
-
-    self.__devices.make_gate(**kwargs)
+    self.__devices.make_gate(device_id=device_id, device_kind=device_kind,
+                             no_of_inputs=no_of_inputs)
 
   @multiple
   def _parse_AND(self):
@@ -205,26 +207,7 @@ class Parser:
 
     self._parse_open_bracket()
 
-    class InvalidHalfPeriod(ValueError): pass
-
-    try:
-      # n
-      sym = self.__scanner.get_symbol()
-      if sym.type != Scanner.NUMBER:
-        raise InvalidHalfPeriod
-      
-      name_string = self.__names.get_name_string(sym.id)
-
-      if name_string[0] == "0":
-        raise InvalidHalfPeriod
-
-      clock_half_period = int(name_string)
-
-      if clock_half_period < 1:
-        raise InvalidHalfPeriod
-
-    except InvalidHalfPeriod:
-      raise ParsingError("Expecting a number > 0", sym=sym)
+    clock_half_period, _ = self._parse_positive_number()
 
     self._parse_close_bracket()
 
@@ -236,8 +219,6 @@ class Parser:
 
     self._parse_open_bracket()
 
-    class InvalidPattern(ValueError): pass
-
     pattern = []
 
     try:
@@ -267,26 +248,7 @@ class Parser:
 
     self._parse_open_bracket()
 
-    class InvalidTime(ValueError): pass
-
-    try:
-      # n
-      sym = self.__scanner.get_symbol()
-      if sym.type != Scanner.NUMBER:
-        raise InvalidTime
-      
-      name_string = self.__names.get_name_string(sym.id)
-
-      if name_string[0] == "0":
-        raise InvalidTime
-
-      clock_half_period = int(name_string)
-
-      if clock_half_period < 1:
-        raise InvalidTime
-
-    except InvalidTime:
-      raise ParsingError("Expecting a number > 0", sym=sym)
+    clock_half_period, _ = self._parse_positive_number()
 
     self._parse_close_bracket()
 
@@ -298,8 +260,6 @@ class Parser:
 
     self._parse_open_bracket()
 
-    class InvalidState(ValueError): pass
-
     try:
       # initial state
       sym = self.__scanner.get_symbol()
@@ -339,49 +299,56 @@ class Parser:
     elif error_code == self.__monitors.MONITOR_PRESENT:
       raise ParsingError("Monitor present")
 
-  def _parse_connection(self, sym):
-    args = [sym.id, None, None, None]
+  def _parse_connection_right(self):
+    # second_device
+    second_device_id = self._parse_identifier()
+    second_port_id = None
 
-    def parse_right():
-      # second_device
-      args[2] = self._parse_identifier()
+    sym = self.__scanner.get_symbol()
 
-      sym = self.__scanner.get_symbol()
+    if sym.type == Scanner.EOL:
+      return second_device_id, second_port_id
 
-      if sym.type == Scanner.EOL:
-        return
+    if sym.type != Scanner.DOT:
+      raise ParsingError("Expecting '.'", sym=sym)
+
+    # second_port_id
+    second_port_id = self._parse_identifier()
 
-      if sym.type != Scanner.DOT:
-        raise ParsingError("Expecting '.'", sym=sym)
+    sym = self.__scanner.get_symbol()
+    if sym.type != Scanner.EOL:
+      raise ParsingError("Expecting EOL", sym=sym)
 
-      # second_port_id
-      args[3] = self._parse_identifier()
+    return second_device_id, second_port_id
 
-      sym = self.__scanner.get_symbol()
-      if sym.type != Scanner.EOL:
-        raise ParsingError("Expecting EOL", sym=sym)
+  def _parse_connection(self, sym):
+    first_device_id = sym.id
+    first_port_id = None
 
     sym = self.__scanner.get_symbol()
     if sym.type == Scanner.EQUALS:
-      parse_right()
+      second_device_id, second_port_id = self._parse_connection_right()
     elif sym.type == Scanner.DOT:
       # first_port
       sym = self.__scanner.get_symbol()
       if sym.type != Scanner.NAME:
         raise ParsingError("Expecting port name", sym=sym)
 
-      args[1] = sym.id
+      first_port_id = sym.id
 
       # =
       sym = self.__scanner.get_symbol()
       if sym.type != Scanner.EQUALS:
         raise ParsingError("Expecting '='", sym=sym)
 
-      parse_right()
+      second_device_id, second_port_id = self._parse_connection_right()
     else:
       raise ParsingError("Expecting . or =", sym=sym)
 
-    error_code = self.__network.make_connection(*args)
+    error_code = self.__network.make_connection(first_device_id,
+                                                first_port_id,
+                                                second_device_id,
+                                                second_port_id)
 
     if error_code != self.__network.NO_ERROR:
       raise ParsingError("Network error")
\ No newline at end of file
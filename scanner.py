@@ -9,7 +9,16 @@ Scanner - reads definition file and translates characters into symbols.
 Symbol - encapsulates a symbol and stores its properties.
 """
 
+import mmap
+import os
 import re
+import stat
+from array import array
+
+# Matches a punctuation character, a line break or a word in the raw bytes of
+# the file, skipping any other whitespace
+TOKENS = re.compile(
+    rb"(?P<punctuation>[.,()=])|(?P<newline>\r\n?|\n)|(?P<word>[^.,()=\s]+)")
 
 
 class Symbol:
@@ -24,6 +33,8 @@ class Symbol:
     No public methods.
     """
 
+    __slots__ = ("type", "id", "loc")
+
     def __init__(self, type=None, id=None, loc=None):
         """Initialize symbol properties."""
         self.type = type
@@ -50,6 +61,9 @@ class Scanner:
     -------------
     get_symbol(self):
         Translates the next sequence of characters into a symbol and returns the symbol.
+
+    Iterating over the scanner yields the remaining symbols, sharing the same
+    position as get_symbol.
     """
 
     # Symbol types
@@ -76,6 +90,32 @@ class Scanner:
     SIGGEN = 20
     RC = 21
 
+    # Stored in place of the name ID of symbols without one, such as EOL.
+    # Names hands out positive IDs, so it cannot be mistaken for a real one
+    NO_ID = -1
+
+    # Symbol types of the reserved words and punctuation
+    KEYWORDS = {
+        "clk": CLOCK,
+        "sig": SIGGEN,
+        "rc": RC,
+        "sw": SWITCH,
+        "and": AND,
+        "or": OR,
+        "nand": NAND,
+        "nor": NOR,
+        "dtype": DTYPE,
+        "xor": XOR,
+        ".": DOT,
+        ",": COMMA,
+        "(": OPEN,
+        ")": CLOSE,
+        " ": WHITESPACE,
+        "=": EQUALS,
+        "": EOL,
+        "monitor": MONITOR,
+    }
+
     def __init__(self, path, names):
         """Open specified file and initialize reserved words and IDs.
 
@@ -89,27 +129,95 @@ class Scanner:
         self.__path = path
         self.__names = names
         self.__done = False
+        # Offsets of the start of each line, found on the first get_line call
+        self.__line_offsets = None
+
+        # Symbols are stored as parallel arrays of their types, name IDs and
+        # locations. Symbols without a name ID or location store NO_ID and -1
+        self.__types = array("B")
+        self.__ids = array("i")
+        self.__locs = array("i")
+        # Index of the next symbol returned by get_symbol
+        self.__position = 0
+
+        # Scan regular files through a read-only memory map instead of
+        # copying them into memory. Empty files cannot be mapped, and pipes
+        # and other special files report a size of 0, so these are read
+        with open(path, 'rb') as f:
+            status = os.fstat(f.fileno())
+            if stat.S_ISREG(status.st_mode) and status.st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    self._scan(data)
+            else:
+                self._scan(f.read())
+
+    def _scan(self, data):
+        """Translate the contents of the definition file into symbols.
+
+        Parameters
+        ----------
+        data: bytes-like
+            Raw contents of the circuit definition file.
+        """
+        add_type = self.__types.append
+        add_id = self.__ids.append
+        add_loc = self.__locs.append
+
+        # Symbol type, name ID and number of bytes beyond its length in
+        # characters of each word seen so far, so that repeated words are
+        # translated with a single dictionary lookup
+        known_words = {}
 
-        def symbol_gen():
-            """Generator function that yields symbols from the circuit definition file."""
-            with open(path, 'r') as f:
-                for line in f:
-                    loc = 0
-                    for w in re.split(r"(\.|,|\(|\)| +|=)", line):
-                        s = w.lower().strip()
+        # Symbol locations are the number of characters from the start of
+        # their line. Only words can contain multi-byte characters, so the
+        # extra bytes of the words read so far on the line are subtracted
+        line_start = 0
+        extra_bytes = 0
+        for match in TOKENS.finditer(data):
+            if match.lastgroup == "newline":
+                # EOL is located just past the line break, counting a
+                # carriage return and line feed pair as one character
+                add_type(self.EOL)
+                add_id(self.NO_ID)
+                add_loc(match.start() + 1 - line_start - extra_bytes)
+                line_start = match.end()
+                extra_bytes = 0
+                continue
 
-                        if s != "":
-                            # Translate word to symbol type and retrieve ID
-                            type = self.get_symbol_type(s)
-                            [id] = self.__names.lookup([s])
+            word = match.group()
+            known = known_words.get(word)
+            if known is None:
+                # Definition files are UTF-8. Words that cannot be decoded
+                # are INVALID symbols, which the parser reports as errors
+                try:
+                    text = word.decode("utf-8")
+                    type = None
+                except UnicodeDecodeError:
+                    text = word.decode("utf-8", "replace")
+                    type = self.INVALID
 
-                            yield Symbol(type=type, id=id, loc=loc)
+                # Names and reserved words are case insensitive
+                s = text.lower()
+                if type is None:
+                    # Translate word to symbol type
+                    type = self.get_symbol_type(s)
+                known = known_words[word] = (
+                    type, self.__names.lookup_one(s), len(word) - len(text))
 
-                        loc += len(w)
-                    yield Symbol(type=self.EOL, loc=loc)
-                yield Symbol(type=self.EOF)
+            type, id, extra = known
+            add_type(type)
+            add_id(id)
+            add_loc(match.start() - line_start - extra_bytes)
+            extra_bytes += extra
 
-        self.__symbols = symbol_gen()
+        # The last line may not end with a line break
+        if line_start < len(data):
+            add_type(self.EOL)
+            add_id(self.NO_ID)
+            add_loc(len(data) - line_start - extra_bytes)
+        add_type(self.EOF)
+        add_id(self.NO_ID)
+        add_loc(-1)
 
     def get_line(self, number):
         """Get a specific line from the circuit definition file.
@@ -124,11 +232,21 @@ class Scanner:
         str or None
             The line corresponding to the given line number, or None if not found.
         """
-        line = None
-        with open(self.__path, 'r') as f:
-            for _ in range(number):
-                line = next(f)
-        return line.strip()
+        # Decode the same way as the scanned symbols, so that their locations
+        # line up with the returned line
+        with open(self.__path, 'r', encoding="utf-8", errors="replace") as f:
+            if self.__line_offsets is None:
+                self.__line_offsets = []
+                offset = f.tell()
+                while f.readline():
+                    self.__line_offsets.append(offset)
+                    offset = f.tell()
+
+            if not 1 <= number <= len(self.__line_offsets):
+                return None
+
+            f.seek(self.__line_offsets[number - 1])
+            return f.readline().strip()
 
     def get_symbol_type(self, w):
         """Determine the type of a word and return the corresponding symbol type.
@@ -143,43 +261,11 @@ class Scanner:
         int
             Symbol type representing the type of the word.
         """
-        if w == "clk":
-            return self.CLOCK
-        if w == "sig":
-            return self.SIGGEN
-        if w == "rc":
-            return self.RC
-        if w == "sw":
-            return self.SWITCH
-        if w == "and":
-            return self.AND
-        if w == "or":
-            return self.OR
-        if w == "nand":
-            return self.NAND
-        if w == "nor":
-            return self.NOR
-        if w == "dtype":
-            return self.DTYPE
-        if w == "xor":
-            return self.XOR
-        if w == '.':
-            return self.DOT
-        if w == ',':
-            return self.COMMA
-        if w == '(':
-            return self.OPEN
-        if w == ')':
-            return self.CLOSE
-        if w == ' ':
-            return self.WHITESPACE
-        if w == '=':
-            return self.EQUALS
-        if w == '':
-            return self.EOL
-        if w == 'monitor':
-            return self.MONITOR
-        if w.isdigit():
+        symbol_type = self.KEYWORDS.get(w)
+        if symbol_type is not None:
+            return symbol_type
+        if w.isdigit() and w.isascii():
+            # NUMBER words only contain the characters 0-9
             return self.NUMBER
         return self.NAME
 
@@ -191,4 +277,29 @@ class Scanner:
         Symbol
             The symbol representing the next sequence of characters in the circuit definition file.
         """
-        return next(self.__symbols)
+        position = self.__position
+        if position == len(self.__types):
+            # Already past EOF
+            raise StopIteration
+        self.__position = position + 1
+
+        type = self.__types[position]
+        if type == self.EOF:
+            return Symbol(type=self.EOF)
+        id = self.__ids[position]
+        return Symbol(type=type, id=id if id != self.NO_ID else None,
+                      loc=self.__locs[position])
+
+    def __iter__(self):
+        """Return an iterator over the remaining symbols.
+
+        Returns
+        -------
+        iterator
+            Iterator yielding the same symbols as repeated calls to get_symbol.
+        """
+        return self
+
+    def __next__(self):
+        """Return the next symbol, as get_symbol does."""
+        return self.get_symbol()
@@ -0,0 +1,43 @@
+"""Test the names module."""
+import pytest
+
+from names import Names
+
+
+@pytest.fixture
+def new_names():
+    """Return a Names class instance with three names added."""
+    new_names = Names()
+    new_names.lookup(["Sw1", "And1", "I1"])
+    return new_names
+
+
+def test_lookup_one_known_name(new_names):
+    """Test if lookup_one returns the existing ID of a known name."""
+    sw1_id = new_names.query("Sw1")
+
+    assert new_names.lookup_one("Sw1") == sw1_id
+    assert new_names.get_name_string(sw1_id) == "Sw1"
+
+
+def test_lookup_one_unknown_name(new_names):
+    """Test if lookup_one adds an unknown name with a new ID."""
+    known_ids = {new_names.query(name) for name in ["Sw1", "And1", "I1"]}
+
+    assert new_names.query("Or1") is None
+    or1_id = new_names.lookup_one("Or1")
+
+    assert or1_id not in known_ids
+    assert new_names.query("Or1") == or1_id
+    assert new_names.get_name_string(or1_id) == "Or1"
+    assert new_names.lookup_one("Or1") == or1_id
+
+
+@pytest.mark.parametrize("name_string", ["Sw1", "I1", "Or1", "I2"])
+def test_lookup_one_matches_lookup(new_names, name_string):
+    """Test if lookup_one agrees with lookup on a single name."""
+    other_names = Names()
+    other_names.lookup(["Sw1", "And1", "I1"])
+
+    assert new_names.lookup_one(name_string) == \
+        other_names.lookup([name_string])[0]
@@ -0,0 +1,278 @@
+"""Test the scanner module."""
+import os
+import threading
+
+import pytest
+
+from names import Names
+from devices import Devices
+from network import Network
+from monitors import Monitors
+from scanner import Scanner
+from parse import Parser
+
+CLOCK = Scanner.CLOCK
+SWITCH = Scanner.SWITCH
+AND = Scanner.AND
+OR = Scanner.OR
+DOT = Scanner.DOT
+COMMA = Scanner.COMMA
+OPEN = Scanner.OPEN
+CLOSE = Scanner.CLOSE
+EQUALS = Scanner.EQUALS
+NAME = Scanner.NAME
+NUMBER = Scanner.NUMBER
+EOL = Scanner.EOL
+EOF = Scanner.EOF
+MONITOR = Scanner.MONITOR
+SIGGEN = Scanner.SIGGEN
+RC = Scanner.RC
+
+
+def scan(path):
+    """Return the symbols of a file as (type, name string, loc) tuples.
+
+    Also check that every symbol ID is the name ID of its name string.
+    """
+    names = Names()
+    scanner = Scanner(path, names)
+    symbols = []
+    while True:
+        symbol = scanner.get_symbol()
+        name_string = names.get_name_string(symbol.id)
+        if symbol.id is not None:
+            assert names.query(name_string) == symbol.id
+        symbols.append((symbol.type, name_string, symbol.loc))
+        if symbol.type == EOF:
+            return symbols
+
+
+@pytest.fixture
+def write_file(tmp_path):
+    """Return a function writing bytes to a definition file."""
+    def write(data):
+        path = tmp_path / "definition.txt"
+        path.write_bytes(data)
+        return str(path)
+    return write
+
+
+def connection(first, second, port):
+    """Return the symbols of a 'first = second.port' line."""
+    return [(NAME, first, 0),
+            (EQUALS, "=", len(first) + 1),
+            (NAME, second, len(first) + 3),
+            (DOT, ".", len(first) + 3 + len(second)),
+            (NAME, port, len(first) + 4 + len(second)),
+            (EOL, None, len(first) + 5 + len(second) + len(port))]
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("def0.txt", [
+        (AND, "and", 0), (NAME, "k", 4), (OPEN, "(", 5), (NUMBER, "2", 6),
+        (CLOSE, ")", 7), (EOL, None, 9),
+        (SWITCH, "sw", 0), (NAME, "sw1", 3), (OPEN, "(", 6),
+        (NUMBER, "1", 7), (CLOSE, ")", 8), (EOL, None, 10),
+        (CLOCK, "clk", 0), (NAME, "clk1", 4), (OPEN, "(", 8),
+        (NUMBER, "1", 9), (CLOSE, ")", 10), (EOL, None, 12),
+        (NAME, "sw1", 0), (EQUALS, "=", 4), (NAME, "k", 7), (DOT, ".", 8),
+        (NAME, "i1", 9), (EOL, None, 12),
+        (NAME, "clk1", 0), (EQUALS, "=", 5), (NAME, "k", 7), (DOT, ".", 8),
+        (NAME, "i2", 9), (EOL, None, 12),
+        # The last line has no line break
+        (MONITOR, "monitor", 0), (NAME, "k1", 8), (EOL, None, 10),
+        (EOF, None, None)]),
+    ("def1.txt", [
+        (SIGGEN, "sig", 0), (NAME, "s1", 4), (OPEN, "(", 6),
+        (NUMBER, "1101", 7), (CLOSE, ")", 11), (EOL, None, 13),
+        (MONITOR, "monitor", 0), (NAME, "s1", 8), (EOL, None, 10),
+        (EOF, None, None)]),
+    ("def2.txt", [
+        (RC, "rc", 0), (NAME, "ccc", 3), (OPEN, "(", 6), (NUMBER, "5", 7),
+        (CLOSE, ")", 8), (EOL, None, 10),
+        (MONITOR, "monitor", 0), (NAME, "ccc", 8), (EOL, None, 11),
+        (EOF, None, None)]),
+    ("def3.txt", [
+        (SWITCH, "sw", 0),
+        (NAME, "a", 3), (OPEN, "(", 4), (NUMBER, "0", 5), (CLOSE, ")", 6),
+        (COMMA, ",", 7),
+        (NAME, "b", 9), (OPEN, "(", 10), (NUMBER, "0", 11), (CLOSE, ")", 12),
+        (COMMA, ",", 13),
+        (NAME, "c", 15), (OPEN, "(", 16), (NUMBER, "0", 17),
+        (CLOSE, ")", 18), (EOL, None, 20),
+        (AND, "and", 0),
+        (NAME, "g1", 4), (OPEN, "(", 6), (NUMBER, "2", 7), (CLOSE, ")", 8),
+        (COMMA, ",", 9),
+        (NAME, "g3", 11), (OPEN, "(", 13), (NUMBER, "2", 14),
+        (CLOSE, ")", 15), (COMMA, ",", 16),
+        (NAME, "g4", 18), (OPEN, "(", 20), (NUMBER, "2", 21),
+        (CLOSE, ")", 22), (EOL, None, 24),
+        (OR, "or", 0),
+        (NAME, "g2", 3), (OPEN, "(", 5), (NUMBER, "2", 6), (CLOSE, ")", 7),
+        (COMMA, ",", 8),
+        (NAME, "g5", 10), (OPEN, "(", 12), (NUMBER, "2", 13),
+        (CLOSE, ")", 14), (EOL, None, 16),
+        (EOL, None, 1)]
+        + connection("a", "g1", "i1") + connection("b", "g1", "i2")
+        + connection("b", "g2", "i1") + connection("b", "g3", "i2")
+        + connection("c", "g2", "i2") + connection("c", "g3", "i1")
+        + connection("g1", "g5", "i1") + connection("g2", "g4", "i1")
+        + connection("g3", "g4", "i2") + connection("g4", "g5", "i2")
+        + [(EOL, None, 1),
+           (MONITOR, "monitor", 0), (NAME, "g5", 8), (EOL, None, 11),
+           # The file ends with a line break, so there is no further EOL
+           (EOF, None, None)]),
+])
+def test_definition_files(path, expected):
+    """Test the symbol types, IDs and locations of the definition files."""
+    assert scan(os.path.join(os.path.dirname(__file__), path)) == expected
+
+
+def test_case_insensitive(write_file):
+    """Test that names and reserved words are case insensitive."""
+    names = Names()
+    scanner = Scanner(write_file(b"SW Sw1(0)\nsw1 = G.I1\n"), names)
+    symbols = [scanner.get_symbol() for _ in range(7)]
+
+    assert symbols[0].type == SWITCH
+    assert symbols[1].id == symbols[6].id == names.query("sw1")
+    assert names.query("Sw1") is None
+
+
+def test_tabs_separate_words(write_file):
+    """Test that tabs separate words the same way as spaces."""
+    assert scan(write_file(b"and\tg1(2),\tg2 (2)\t\n")) == [
+        (AND, "and", 0), (NAME, "g1", 4), (OPEN, "(", 6), (NUMBER, "2", 7),
+        (CLOSE, ")", 8), (COMMA, ",", 9), (NAME, "g2", 11), (OPEN, "(", 14),
+        (NUMBER, "2", 15), (CLOSE, ")", 16), (EOL, None, 19),
+        (EOF, None, None)]
+
+
+def test_line_breaks(write_file):
+    """Test that CRLF and lone CR line breaks are counted as one character."""
+    assert scan(write_file(b"sw a(0)\r\nsw b(1)\rmonitor a")) == [
+        (SWITCH, "sw", 0), (NAME, "a", 3), (OPEN, "(", 4), (NUMBER, "0", 5),
+        (CLOSE, ")", 6), (EOL, None, 8),
+        (SWITCH, "sw", 0), (NAME, "b", 3), (OPEN, "(", 4), (NUMBER, "1", 5),
+        (CLOSE, ")", 6), (EOL, None, 8),
+        (MONITOR, "monitor", 0), (NAME, "a", 8), (EOL, None, 9),
+        (EOF, None, None)]
+
+
+def test_blank_lines(write_file):
+    """Test that every line, including blank ones, ends with an EOL."""
+    assert scan(write_file(b"\n  \n\t")) == [
+        (EOL, None, 1), (EOL, None, 3), (EOL, None, 1), (EOF, None, None)]
+
+
+def test_get_symbol_past_eof(write_file):
+    """Test that get_symbol stops the iteration once EOF has been returned."""
+    scanner = Scanner(write_file(b"sw a(0)"), Names())
+    symbols = [scanner.get_symbol() for _ in range(7)]
+
+    assert [symbol.type for symbol in symbols[-2:]] == [EOL, EOF]
+    with pytest.raises(StopIteration):
+        scanner.get_symbol()
+
+
+def test_iteration_shares_position(write_file):
+    """Test that iterating over the scanner continues from get_symbol."""
+    scanner = Scanner(write_file(b"sw a(0)\nmonitor a\n"), Names())
+
+    assert scanner.get_symbol().type == SWITCH
+    assert scanner.get_symbol().type == NAME
+    types = []
+    for symbol in scanner:
+        types.append(symbol.type)
+        if symbol.type == EOL:
+            break
+    assert types == [OPEN, NUMBER, CLOSE, EOL]
+    assert scanner.get_symbol().type == MONITOR
+    assert [symbol.type for symbol in scanner] == [NAME, EOL, EOF]
+
+
+def test_get_line(write_file):
+    """Test that get_line returns the stripped line, or None if absent."""
+    scanner = Scanner(write_file(b"sw a(0)  \n\n  monitor a"), Names())
+
+    assert scanner.get_line(1) == "sw a(0)"
+    assert scanner.get_line(2) == ""
+    assert scanner.get_line(3) == "monitor a"
+    assert scanner.get_line(1) == "sw a(0)"
+    assert scanner.get_line(0) is None
+    assert scanner.get_line(4) is None
+
+
+def test_empty_file(write_file):
+    """Test that an empty file only contains EOF."""
+    assert scan(write_file(b"")) == [(EOF, None, None)]
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs named pipes")
+def test_pipe(tmp_path):
+    """Test that a definition piped through a FIFO is read in full."""
+    path = str(tmp_path / "definition")
+    os.mkfifo(path)
+
+    def write():
+        with open(path, "wb") as f:
+            f.write(b"rc ccc(5)\nmonitor ccc")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    try:
+        symbols = scan(path)
+    finally:
+        writer.join()
+
+    assert symbols == [
+        (RC, "rc", 0), (NAME, "ccc", 3), (OPEN, "(", 6), (NUMBER, "5", 7),
+        (CLOSE, ")", 8), (EOL, None, 10),
+        (MONITOR, "monitor", 0), (NAME, "ccc", 8), (EOL, None, 11),
+        (EOF, None, None)]
+
+
+def test_non_ascii_locations(write_file):
+    """Test that locations count characters, not bytes, as get_line does."""
+    path = write_file("sw é1(0), b(1)\nmonitor é1".encode("utf-8"))
+    scanner = Scanner(path, Names())
+
+    assert scan(path) == [
+        (SWITCH, "sw", 0), (NAME, "é1", 3), (OPEN, "(", 5), (NUMBER, "0", 6),
+        (CLOSE, ")", 7), (COMMA, ",", 8), (NAME, "b", 10), (OPEN, "(", 11),
+        (NUMBER, "1", 12), (CLOSE, ")", 13), (EOL, None, 15),
+        (MONITOR, "monitor", 0), (NAME, "é1", 8), (EOL, None, 10),
+        (EOF, None, None)]
+    assert scanner.get_line(1)[10] == "b"
+
+
+def test_invalid_utf8(write_file):
+    """Test that words which are not valid UTF-8 are INVALID symbols."""
+    path = write_file(b"sw a\xff(0), b(1)\n")
+    scanner = Scanner(path, Names())
+
+    assert [(symbol.type, symbol.loc) for symbol in scanner][:3] == [
+        (SWITCH, 0), (Scanner.INVALID, 3), (OPEN, 5)]
+    assert scanner.get_line(1) == "sw a�(0), b(1)"
+
+
+def test_invalid_utf8_is_parse_error(write_file, capsys):
+    """Test that the parser reports an invalid word instead of raising."""
+    names = Names()
+    devices = Devices(names)
+    network = Network(names, devices)
+    monitors = Monitors(names, devices, network)
+    scanner = Scanner(write_file(b"sw a(0)\n\xff = a\n"), names)
+    parser = Parser(names, devices, network, monitors, scanner)
+
+    assert not parser.parse_network()
+    assert "Invalid character" in capsys.readouterr().out
+
+
+def test_eof_symbols_are_separate(write_file):
+    """Test that changing one scanner's EOF symbol leaves others intact."""
+    path = write_file(b"")
+    first_eof = Scanner(path, Names()).get_symbol()
+    first_eof.loc = 0
+
+    assert Scanner(path, Names()).get_symbol().loc is None
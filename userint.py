@@ -248,13 +248,19 @@ class UserInterface:
 
         Return True if successful.
         """
+        # Bind the per-cycle methods once, outside the loop
+        execute_network = self.network.execute_network
+        record_signals = self.monitors.record_signals
+        # Nothing needs recording or displaying if no signal is monitored
+        monitoring = bool(self.monitors.monitors_dictionary)
         for _ in range(cycles):
-            if self.network.execute_network():
-                self.monitors.record_signals()
-            else:
+            if not execute_network():
                 print("Error! Network oscillating.")
                 return False
-        self.monitors.display_signals()
+            if monitoring:
+                record_signals()
+        if monitoring:
+            self.monitors.display_signals()
         return True
 
     def run_command(self):